@@ -0,0 +1,13 @@
+"""
+Loads the project's .env file exactly once per process.
+"""
+from functools import lru_cache
+from pathlib import Path
+from dotenv import load_dotenv
+
+_DOTENV_PATH:Path=Path(__file__).resolve().parent.parent/'.env'
+
+
+@lru_cache(maxsize=1)
+def _ensure_env_loaded()->None:
+    load_dotenv(dotenv_path=_DOTENV_PATH)
@@ -4,9 +4,9 @@ Serves all base requirements for Django application configuration.
 import os
 from pathlib import Path
 from typing import Dict, Any
-from dotenv import load_dotenv
+from config._env import _ensure_env_loaded
 
-load_dotenv()
+_ensure_env_loaded()
 
 BASE_DIR:Path=Path(__file__).resolve().parent.parent.parent
 DEBUG:bool=True
@@ -4,11 +4,11 @@ Endpoint for all of Django's administrative tasks.
 
 import os
 import sys
-from dotenv import load_dotenv
+from config._env import _ensure_env_loaded
 # from utils.general import fetch_default_module
 
 
-load_dotenv()
+_ensure_env_loaded()
 # settings_module= fetch_default_module()
 
 def main():